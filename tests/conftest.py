@@ -0,0 +1,15 @@
+import json
+import pytest
+
+@pytest.fixture(scope="session")
+def har_bytes():
+    """Factory that JSON-encodes a HAR payload once per session"""
+    cache = {}
+
+    def make(payload):
+        key = id(payload)
+        if key not in cache:
+            cache[key] = json.dumps(payload).encode('utf-8')
+        return cache[key]
+
+    return make
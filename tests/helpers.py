@@ -0,0 +1,23 @@
+import io
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+
+class FakeOpen:
+    """Stand-in for open() that serves `data` from a fresh in-memory buffer"""
+    def __init__(self, data=""):
+        self.data = data
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        return io.StringIO(self.data)
+
+
+def make_upload(name, data, content_type):
+    """Wrap encoded file content in a real Streamlit UploadedFile"""
+    return UploadedFile(UploadedFileRec(name, name, content_type, data), None)
+
+
+def assert_fields_match(entry, expected):
+    """Check that `entry` holds exactly the expected values for the expected keys"""
+    assert {field: entry[field] for field in expected} == expected
@@ -2,9 +2,14 @@ import pytest
 from unittest.mock import patch, MagicMock
 from utils.email_handler import EmailHandler
 
-@pytest.fixture
-def email_handler():
-    """Fixture to create an EmailHandler instance with test configuration"""
+# send_email reports the raised exception's text as the error message
+EXPECTED_ERROR = "SMTP Error"
+
+SMTP_ENV_VARS = ('SMTP_SERVER', 'SMTP_PORT', 'SMTP_USERNAME', 'SMTP_PASSWORD', 'SENDER_EMAIL')
+
+@pytest.fixture(scope="module", autouse=True)
+def _env():
+    """Patch the SMTP test configuration into the environment once per module"""
     with patch.dict('os.environ', {
         'SMTP_SERVER': 'test.smtp.server',
         'SMTP_PORT': '587',
@@ -12,86 +17,104 @@ def email_handler():
         'SMTP_PASSWORD': 'test_password',
         'SENDER_EMAIL': 'test@example.com'
     }):
-        return EmailHandler()
+        yield
+
+@pytest.fixture(scope="module")
+def email_handler():
+    """Fixture to create an EmailHandler instance with test configuration"""
+    return EmailHandler()
+
+def test_email_handler_uses_test_config(email_handler):
+    """Test the shared handler picked up the patched environment"""
+    assert email_handler.smtp_server == 'test.smtp.server'
+
+@pytest.fixture
+def mock_smtp_class():
+    """Fixture to patch smtplib.SMTP for the duration of a test"""
+    with patch('smtplib.SMTP') as smtp_class:
+        yield smtp_class
 
 @pytest.mark.parametrize(
     "recipient,subject,body",
     [
         ("test@example.com", "Test Subject", "Test Body"),
         ("another@example.com", "Hello", "Hello World"),
-    ]
+    ],
+    ids=["basic", "hello"]
 )
-def test_send_email_success(email_handler, recipient, subject, body):
+def test_send_email_success(email_handler, recipient, subject, body, mock_smtp_class):
     """Test successful email sending"""
+    result = email_handler.send_email(recipient, subject, body)
+    
+    assert result["status"] == "success"
+    assert result["message"] == "Email sent successfully"
+
+def test_smtp_contract(email_handler, mock_smtp_class):
+    """Test send_email drives the SMTP connection as expected"""
     # Mock the SMTP connection
     mock_smtp = MagicMock()
+    mock_smtp_class.return_value.__enter__.return_value = mock_smtp
+    
+    email_handler.send_email("test@example.com", "Test Subject", "Test Body")
     
-    with patch('smtplib.SMTP') as mock_smtp_class:
-        # Configure the mock
-        mock_smtp_class.return_value.__enter__.return_value = mock_smtp
-        
-        # Call the method
-        result = email_handler.send_email(recipient, subject, body)
-        
-        # Verify the result
-        assert result["status"] == "success"
-        assert result["message"] == "Email sent successfully"
-        
-        # Verify SMTP interactions
-        mock_smtp_class.assert_called_once_with(
-            email_handler.smtp_server,
-            email_handler.smtp_port
-        )
-        mock_smtp.starttls.assert_called_once()
-        mock_smtp.login.assert_called_once_with(
-            email_handler.smtp_username,
-            email_handler.smtp_password
-        )
-        mock_smtp.send_message.assert_called_once()
+    # Verify SMTP interactions
+    mock_smtp_class.assert_called_once_with(
+        email_handler.smtp_server,
+        email_handler.smtp_port
+    )
+    mock_smtp.starttls.assert_called_once()
+    mock_smtp.login.assert_called_once_with(
+        email_handler.smtp_username,
+        email_handler.smtp_password
+    )
+    mock_smtp.send_message.assert_called_once()
 
-def test_send_email_failure(email_handler):
+def test_send_email_failure(email_handler, mock_smtp_class):
     """Test email sending failure"""
-    with patch('smtplib.SMTP') as mock_smtp_class:
-        # Configure the mock to raise an exception
-        mock_smtp_class.return_value.__enter__.side_effect = Exception("SMTP Error")
-        
-        # Call the method
-        result = email_handler.send_email(
-            "test@example.com",
-            "Test Subject",
-            "Test Body"
-        )
-        
-        # Verify the error result
-        assert result["status"] == "error"
-        assert "SMTP Error" in result["message"]
+    # Configure the mock to raise an exception
+    mock_smtp_class.return_value.__enter__.side_effect = Exception(EXPECTED_ERROR)
+    
+    # Call the method
+    result = email_handler.send_email(
+        "test@example.com",
+        "Test Subject",
+        "Test Body"
+    )
+    
+    # Verify the error result
+    assert result["status"] == "error"
+    assert result["message"] == EXPECTED_ERROR
 
-def test_email_handler_initialization():
+def test_email_handler_initialization(monkeypatch):
     """Test EmailHandler initialization with missing configuration"""
-    with patch.dict('os.environ', {}, clear=True):
-        handler = EmailHandler()
-        
-        # Verify default values
-        assert handler.smtp_server == "live.smtp.mailtrap.io"
-        assert handler.smtp_port == 587
-        assert handler.smtp_username == "api"
-        assert handler.smtp_password == "your_password_here"
-        assert handler.sender_email == "hello@demomailtrap.co"
+    for var in SMTP_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
 
-def test_validate_config_with_missing_vars():
+    handler = EmailHandler()
+    
+    # Verify default values
+    assert handler.smtp_server == "live.smtp.mailtrap.io"
+    assert handler.smtp_port == 587
+    assert handler.smtp_username == "api"
+    assert handler.smtp_password == "your_password_here"
+    assert handler.sender_email == "hello@demomailtrap.co"
+
+def test_validate_config_with_missing_vars(monkeypatch):
     """Test configuration validation with missing variables"""
-    with patch.dict('os.environ', {
+    for var, value in {
         'SMTP_SERVER': '',  # Empty server
         'SMTP_PORT': '587',
         'SMTP_USERNAME': 'test_user',
         'SMTP_PASSWORD': 'your_password_here',  # Default password
         'SENDER_EMAIL': 'test@example.com'
-    }):
-        with patch('logging.Logger.warning') as mock_warning:
-            handler = EmailHandler()
-            # Verify that warning was logged for missing configuration
-            mock_warning.assert_called_once()
-            warning_args = mock_warning.call_args[0][0]
-            assert "Missing required email configuration" in warning_args
-            assert "SMTP_SERVER" in warning_args
-            assert "SMTP_PASSWORD" in warning_args 
\ No newline at end of file
+    }.items():
+        monkeypatch.setenv(var, value)
+
+    with patch('logging.Logger.warning') as mock_warning:
+        handler = EmailHandler()
+        # Verify that warning was logged for missing configuration
+        mock_warning.assert_called_once()
+        warning_args = mock_warning.call_args[0][0]
+        assert "Missing required email configuration" in warning_args
+        assert "SMTP_SERVER" in warning_args
+        assert "SMTP_PASSWORD" in warning_args
@@ -1,12 +1,14 @@
-import json
 import pytest
 from pathlib import Path
-from unittest.mock import mock_open, patch, MagicMock
+from unittest.mock import patch
+# NOTE: sanitize_url is commented out in app/core/parse_har.py, so this import
+# fails and the whole module errors at collection until it is restored.
 from app.core.parse_har import (
     sanitize_header_value,
     sanitize_url,
     parse_har_files
 )
+from tests.helpers import FakeOpen, assert_fields_match, make_upload
 
 # Test data
 SAMPLE_HAR_DATA = {
@@ -32,13 +34,95 @@ SAMPLE_HAR_DATA = {
     }
 }
 
+ERROR_HAR_DATA = {
+    "log": {
+        "entries": [{
+            "request": {
+                "url": "https://api.example.com/error",
+                "method": "GET",
+                "headers": []
+            },
+            "response": {
+                "status": 404,
+                "statusText": "Not Found",
+                "bodySize": 0
+            },
+            "timings": {
+                "total": 50
+            }
+        }]
+    }
+}
+
+REDIRECT_HAR_DATA = {
+    "log": {
+        "entries": [{
+            "request": {
+                "url": "https://api.example.com/old",
+                "method": "GET",
+                "headers": []
+            },
+            "response": {
+                "status": 302,
+                "statusText": "Found",
+                "redirectURL": "https://api.example.com/new",
+                "bodySize": 0
+            },
+            "timings": {
+                "total": 30
+            }
+        }]
+    }
+}
+
+INVALID_HAR_DATA = {"log": {"entries": [{}]}}  # Missing required fields
+
+# (file name, HAR payload, expected entry fields or None when nothing should parse)
+HAR_CASES = [
+    ("test.har", SAMPLE_HAR_DATA, {
+        "file_id": "test",
+        "method": "GET",
+        "status_code": 200,
+        "response_time": 100,
+        "response_size": 1234,
+        "request_headers": {
+            "Authorization": "[REDACTED]",
+            "Content-Type": "application/json"
+        }
+    }),
+    ("error.har", ERROR_HAR_DATA, {
+        "status_code": 404,
+        "error_message": "HTTP 404: Not Found"
+    }),
+    ("redirect.har", REDIRECT_HAR_DATA, {
+        "status_code": 302,
+        "error_message": "Redirect to: https://api.example.com/new"
+    }),
+    ("invalid.har", INVALID_HAR_DATA, None),
+]
+
+@pytest.fixture
+def _isolate_output(tmp_path, monkeypatch):
+    """Keep parse_har_files from overwriting data/processed in the repo"""
+    monkeypatch.chdir(tmp_path)
+
+def _assert_entry_matches(results, expected):
+    """Check the parsed entry against the expected fields"""
+    if expected is None:
+        # Should handle the error gracefully and return empty results
+        assert len(results) == 0
+        return
+
+    assert len(results) == 1
+    assert_fields_match(results[0], expected)
+
 @pytest.mark.parametrize("header_name,header_value,expected", [
     ("authorization", "Bearer token123", "[REDACTED]"),
     ("cookie", "session=abc123", "[REDACTED]"),
     ("x-csrf-token", "xyz789", "[REDACTED]"),
     ("content-type", "application/json", "application/json"),
     ("accept", "*/*", "*/*"),
-])
+], ids=["authz", "cookie", "csrf", "content_type", "accept"])
 def test_sanitize_header_value(header_name, header_value, expected):
     """Test header value sanitization"""
     result = sanitize_header_value(header_name, header_value)
@@ -61,128 +145,31 @@ def test_sanitize_header_value(header_name, header_value, expected):
         "invalid-url",
         "invalid-url"
     ),
-])
+], ids=["key", "token", "no_query", "invalid"])
 def test_sanitize_url(url, expected):
     """Test URL sanitization"""
     result = sanitize_url(url)
     assert result == expected
 
-def test_parse_har_files_with_uploaded_file():
-    """Test parsing uploaded HAR file"""
-    mock_file = MagicMock()
-    mock_file.name = "test.har"
-    # Fix: Return bytes directly instead of using lambda
-    mock_file.read.return_value = json.dumps(SAMPLE_HAR_DATA).encode('utf-8')
-    mock_file.content_type = 'application/json'
-    mock_file.seek = MagicMock()
-
-    results = parse_har_files([mock_file])
-
-    assert len(results) == 1
-    entry = results[0]
-    assert entry["file_id"] == "test"
-    assert entry["method"] == "GET"
-    assert entry["status_code"] == 200
-    assert entry["response_time"] == 100
-    assert entry["response_size"] == 1234
-    assert "[REDACTED]" in entry["request_headers"]["Authorization"]
+@pytest.mark.usefixtures("_isolate_output")
+@pytest.mark.parametrize(
+    "name,payload,expected", HAR_CASES, ids=["success", "error", "redirect", "invalid"]
+)
+def test_parse_har_files_with_uploaded_file(har_bytes, name, payload, expected):
+    """Test parsing uploaded HAR files"""
+    results = parse_har_files([make_upload(name, har_bytes(payload), 'application/json')])
+    _assert_entry_matches(results, expected)
 
-def test_parse_har_files_with_local_file():
+@pytest.mark.usefixtures("_isolate_output")
+def test_parse_har_files_with_local_file(har_bytes):
     """Test parsing local HAR file"""
-    mock_content = json.dumps(SAMPLE_HAR_DATA)
-    
-    with patch("builtins.open", mock_open(read_data=mock_content)):
-        with patch("pathlib.Path.glob") as mock_glob:
-            mock_glob.return_value = [Path("test.har")]
-            results = parse_har_files()
+    with (
+        patch("builtins.open", FakeOpen(har_bytes(SAMPLE_HAR_DATA).decode('utf-8'))),
+        patch("pathlib.Path.glob", return_value=[Path("test.har")]),
+    ):
+        results = parse_har_files()
 
     assert len(results) == 1
     entry = results[0]
     assert entry["file_id"] == "test"
     assert entry["status_code"] == 200
-
-def test_parse_har_files_with_error_entry():
-    """Test parsing HAR entry with error status code"""
-    error_har_data = {
-        "log": {
-            "entries": [{
-                "request": {
-                    "url": "https://api.example.com/error",
-                    "method": "GET",
-                    "headers": []
-                },
-                "response": {
-                    "status": 404,
-                    "statusText": "Not Found",
-                    "bodySize": 0
-                },
-                "timings": {
-                    "total": 50
-                }
-            }]
-        }
-    }
-
-    mock_file = MagicMock()
-    mock_file.name = "error.har"
-    # Fix: Return bytes directly
-    mock_file.read.return_value = json.dumps(error_har_data).encode('utf-8')
-    mock_file.content_type = 'application/json'
-    mock_file.seek = MagicMock()
-
-    results = parse_har_files([mock_file])
-
-    assert len(results) == 1
-    entry = results[0]
-    assert entry["status_code"] == 404
-    assert "HTTP 404: Not Found" in entry["error_message"]
-
-def test_parse_har_files_with_invalid_data():
-    """Test parsing invalid HAR data"""
-    invalid_har_data = {"log": {"entries": [{}]}}  # Missing required fields
-    
-    mock_file = MagicMock()
-    mock_file.name = "invalid.har"
-    mock_file.read.return_value = json.dumps(invalid_har_data).encode()
-
-    results = parse_har_files([mock_file])
-    
-    # Should handle the error gracefully and return empty results
-    assert len(results) == 0
-
-def test_parse_har_files_with_redirect():
-    """Test parsing HAR entry with redirect"""
-    redirect_har_data = {
-        "log": {
-            "entries": [{
-                "request": {
-                    "url": "https://api.example.com/old",
-                    "method": "GET",
-                    "headers": []
-                },
-                "response": {
-                    "status": 302,
-                    "statusText": "Found",
-                    "redirectURL": "https://api.example.com/new",
-                    "bodySize": 0
-                },
-                "timings": {
-                    "total": 30
-                }
-            }]
-        }
-    }
-
-    mock_file = MagicMock()
-    mock_file.name = "redirect.har"
-    # Fix: Return bytes directly
-    mock_file.read.return_value = json.dumps(redirect_har_data).encode('utf-8')
-    mock_file.content_type = 'application/json'
-    mock_file.seek = MagicMock()
-
-    results = parse_har_files([mock_file])
-
-    assert len(results) == 1
-    entry = results[0]
-    assert entry["status_code"] == 302
-    assert "Redirect to: https://api.example.com/new" in entry["error_message"] 
\ No newline at end of file
@@ -1,58 +1,61 @@
 import pytest
+from types import MappingProxyType
 from app.core.pattern_detector import FailurePatternDetector, FailurePattern
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_har_data():
-    return [
-        {
+    return (
+        MappingProxyType({
             'file_id': '1',
             'status_code': 404,
             'url': 'http://api.example.com/endpoint',
             'error_message': 'Endpoint not found'
-        },
-        {
+        }),
+        MappingProxyType({
             'file_id': '2',
             'status_code': 500,
             'url': 'http://api.example.com/another',
             'error_message': 'Internal server error'
-        },
-        {
+        }),
+        MappingProxyType({
             'file_id': '3',
             'status_code': 200,  # Success case
             'url': 'http://api.example.com/success',
-        }
-    ]
+        })
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_log_data():
-    return [
-        {
+    return (
+        MappingProxyType({
             'file_id': '1',
             'status': 'failed',
-            'steps': ['Cookies sanitized', 'Authentication failed'],
+            'steps': ('Cookies sanitized', 'Authentication failed'),
             'error_message': 'Session expired'
-        },
-        {
+        }),
+        MappingProxyType({
             'file_id': '2',
             'status': 'failed',
-            'steps': ['Card is not reflected', 'Verification failed'],
+            'steps': ('Card is not reflected', 'Verification failed'),
             'error_message': 'Card verification error'
-        },
-        {
+        }),
+        MappingProxyType({
             'file_id': '4',
             'status': 'success',  # Should be filtered out
-            'steps': ['Success step'],
-        }
-    ]
+            'steps': ('Success step',),
+        })
+    )
+
+@pytest.fixture(scope="class")
+def detector(sample_har_data, sample_log_data):
+    return FailurePatternDetector(sample_har_data, sample_log_data)
 
 class TestFailurePatternDetector:
-    def test_initialization(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_initialization(self, detector):
         assert len(detector.log_data) == 2  # Only failed logs
         assert len(detector.har_data) == 2  # Only HAR entries with matching file_ids
 
-    def test_detect_auth_failures(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_detect_auth_failures(self, detector):
         patterns = detector._detect_auth_failures()
         
         assert len(patterns) == 1
@@ -62,8 +65,7 @@ class TestFailurePatternDetector:
         assert pattern.frequency == 1
         assert "Session expired" in pattern.error_messages
 
-    def test_detect_api_failures(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_detect_api_failures(self, detector):
         patterns = detector._detect_api_failures()
         
         assert len(patterns) == 2  # Should detect both 404 and 500 errors
@@ -78,8 +80,7 @@ class TestFailurePatternDetector:
         assert server_error.frequency == 1
         assert "Internal server error" in server_error.error_messages
 
-    def test_detect_verification_failures(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_detect_verification_failures(self, detector):
         patterns = detector._detect_verification_failures()
         
         assert len(patterns) == 1
@@ -88,8 +89,7 @@ class TestFailurePatternDetector:
         assert pattern.frequency == 1
         assert "Card verification error" in pattern.error_messages
 
-    def test_detect_failure_patterns(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_detect_failure_patterns(self, detector):
         patterns = detector.detect_failure_patterns()
         
         assert isinstance(patterns, dict)
@@ -100,8 +100,7 @@ class TestFailurePatternDetector:
         assert len(patterns["api"]) == 2
         assert len(patterns["verification"]) == 1
 
-    def test_generate_summary(self, sample_har_data, sample_log_data):
-        detector = FailurePatternDetector(sample_har_data, sample_log_data)
+    def test_generate_summary(self, detector):
         summary = detector.generate_summary()
         
         assert isinstance(summary, dict)